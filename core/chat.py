@@ -1,3 +1,4 @@
+import asyncio
 from core.claude import Claude
 from mcp_client import MCPClient
 from core.tools import ToolManager
@@ -19,12 +20,20 @@ class Chat:
     ) -> str:
         final_text_response = ""
 
-        await self._process_query(query)
+        # Tool discovery and query preprocessing (which may read resources)
+        # are independent round-trips to the MCP servers, so overlap them.
+        tools, _ = await asyncio.gather(
+            ToolManager.get_all_tools(self.clients),
+            self._process_query(query),
+        )
 
         while True:
-            response = self.claude_service.chat(
+            # The Anthropic client is synchronous; run it in a worker thread so
+            # MCP sessions keep servicing notifications while Claude responds
+            response = await asyncio.to_thread(
+                self.claude_service.chat,
                 messages=self.messages,
-                tools=await ToolManager.get_all_tools(self.clients),
+                tools=tools,
             )
 
             self.claude_service.add_assistant_message(self.messages, response)
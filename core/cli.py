@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
@@ -177,8 +178,7 @@ class CliApp:
         )
 
     async def initialize(self):
-        await self.refresh_resources()
-        await self.refresh_prompts()
+        await asyncio.gather(self.refresh_resources(), self.refresh_prompts())
 
     async def refresh_resources(self):
         try:
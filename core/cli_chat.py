@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Tuple
 from mcp.types import Prompt, PromptMessage
 from anthropic.types import MessageParam
@@ -36,12 +37,13 @@ class CliChat(Chat):
         mentions = [word[1:] for word in query.split() if word.startswith("@")]
 
         doc_ids = await self.list_docs_ids()
-        mentioned_docs: list[Tuple[str, str]] = []
+        mentioned_ids = [doc_id for doc_id in doc_ids if doc_id in mentions]
 
-        for doc_id in doc_ids:
-            if doc_id in mentions:
-                content = await self.get_doc_content(doc_id)
-                mentioned_docs.append((doc_id, content))
+        # The document reads are independent, so fetch them concurrently
+        contents = await asyncio.gather(
+            *(self.get_doc_content(doc_id) for doc_id in mentioned_ids)
+        )
+        mentioned_docs: list[Tuple[str, str]] = list(zip(mentioned_ids, contents))
 
         return "".join(
             f'\n<document id="{doc_id}">\n{content}\n</document>\n'
@@ -1,17 +1,45 @@
+import asyncio
 import json
+import weakref
 from typing import Optional, Literal, List
-from mcp.types import CallToolResult, Tool, TextContent
+from mcp.types import Tool, TextContent
 from mcp_client import MCPClient
 from anthropic.types import Message, ToolResultBlockParam
 
+# Upper bound on tool calls dispatched at once for a single assistant message
+MAX_CONCURRENT_TOOL_CALLS = 4
+
+# Seconds a single tool call may take before it is reported as failed
+TOOL_CALL_TIMEOUT = 30
+
 
 class ToolManager:
+    # Each client's list_tools() result is fetched once and reused by every
+    # lookup. The cache is never invalidated: tools/list_changed notifications
+    # are not handled, so a server whose tools change at runtime keeps
+    # serving the first list until the process restarts.
+    _tools_cache: "weakref.WeakKeyDictionary[MCPClient, list[Tool]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @classmethod
+    async def _list_tools(cls, client: MCPClient) -> list[Tool]:
+        """Lists the tools of a client, using the cached result if present."""
+        tools = cls._tools_cache.get(client)
+        if tools is None:
+            tools = await client.list_tools()
+            cls._tools_cache[client] = tools
+        return tools
+
     @classmethod
     async def get_all_tools(cls, clients: dict[str, MCPClient]) -> list[Tool]:
         """Gets all tools from the provided clients."""
+        # Query every client at once; results keep the clients' order.
+        tool_lists = await asyncio.gather(
+            *(cls._list_tools(client) for client in clients.values())
+        )
         tools = []
-        for client in clients.values():
-            tool_models = await client.list_tools()
+        for tool_models in tool_lists:
             tools += [
                 {
                     "name": t.name,
@@ -28,7 +56,7 @@ class ToolManager:
     ) -> Optional[MCPClient]:
         """Finds the first client that has the specified tool."""
         for client in clients:
-            tools = await client.list_tools()
+            tools = await cls._list_tools(client)
             tool = next((t for t in tools if t.name == tool_name), None)
             if tool:
                 return client
@@ -49,59 +77,78 @@ class ToolManager:
             "is_error": status == "error",
         }
 
+    @classmethod
+    async def _execute_tool_request(
+        cls, clients: dict[str, MCPClient], tool_request
+    ) -> ToolResultBlockParam:
+        """Executes a single tool request against the provided clients."""
+        tool_use_id = tool_request.id
+        tool_name = tool_request.name
+        tool_input = tool_request.input
+
+        client = await cls._find_client_with_tool(
+            list(clients.values()), tool_name
+        )
+
+        if not client:
+            return cls._build_tool_result_part(
+                tool_use_id, "Could not find that tool", "error"
+            )
+
+        try:
+            # wait_for rather than asyncio.timeout, which needs Python 3.11+
+            tool_output = await asyncio.wait_for(
+                client.call_tool(tool_name, tool_input), TOOL_CALL_TIMEOUT
+            )
+            items = []
+            if tool_output:
+                items = tool_output.content
+            content_list = [
+                item.text for item in items if isinstance(item, TextContent)
+            ]
+            content_json = json.dumps(content_list)
+            return cls._build_tool_result_part(
+                tool_use_id,
+                content_json,
+                "error" if tool_output and tool_output.isError else "success",
+            )
+        except asyncio.TimeoutError:
+            error_message = (
+                f"Tool '{tool_name}' timed out after {TOOL_CALL_TIMEOUT}s"
+            )
+            print(error_message)
+            return cls._build_tool_result_part(
+                tool_use_id, json.dumps({"error": error_message}), "error"
+            )
+        except Exception as e:
+            error_message = f"Error executing tool '{tool_name}': {e}"
+            print(error_message)
+            return cls._build_tool_result_part(
+                tool_use_id, json.dumps({"error": error_message}), "error"
+            )
+
     @classmethod
     async def execute_tool_requests(
-        cls, clients: dict[str, MCPClient], message: Message
+        cls,
+        clients: dict[str, MCPClient],
+        message: Message,
+        max_concurrent: int = MAX_CONCURRENT_TOOL_CALLS,
     ) -> List[ToolResultBlockParam]:
-        """Executes a list of tool requests against the provided clients."""
+        """Executes a list of tool requests concurrently against the provided clients.
+
+        Tool requests within a single message are independent, so they are
+        dispatched together (bounded by ``max_concurrent``) and the results
+        are returned in the same order as the requests. They do not *run* in
+        order, though: tools that mutate shared state (e.g. code_debug on a
+        file) must serialize that access themselves on the server side.
+        """
         tool_requests = [
             block for block in message.content if block.type == "tool_use"
         ]
-        tool_result_blocks: list[ToolResultBlockParam] = []
-        for tool_request in tool_requests:
-            tool_use_id = tool_request.id
-            tool_name = tool_request.name
-            tool_input = tool_request.input
-
-            client = await cls._find_client_with_tool(
-                list(clients.values()), tool_name
-            )
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run(tool_request) -> ToolResultBlockParam:
+            async with semaphore:
+                return await cls._execute_tool_request(clients, tool_request)
 
-            if not client:
-                tool_result_part = cls._build_tool_result_part(
-                    tool_use_id, "Could not find that tool", "error"
-                )
-                tool_result_blocks.append(tool_result_part)
-                continue
-
-            try:
-                tool_output: CallToolResult | None = await client.call_tool(
-                    tool_name, tool_input
-                )
-                items = []
-                if tool_output:
-                    items = tool_output.content
-                content_list = [
-                    item.text for item in items if isinstance(item, TextContent)
-                ]
-                content_json = json.dumps(content_list)
-                tool_result_part = cls._build_tool_result_part(
-                    tool_use_id,
-                    content_json,
-                    "error"
-                    if tool_output and tool_output.isError
-                    else "success",
-                )
-            except Exception as e:
-                error_message = f"Error executing tool '{tool_name}': {e}"
-                print(error_message)
-                tool_result_part = cls._build_tool_result_part(
-                    tool_use_id,
-                    json.dumps({"error": error_message}),
-                    "error"
-                    if tool_output and tool_output.isError
-                    else "success",
-                )
-
-            tool_result_blocks.append(tool_result_part)
-        return tool_result_blocks
+        return list(await asyncio.gather(*(run(t) for t in tool_requests)))
@@ -15,6 +15,8 @@ Features:
 
 Installation:
     pip install mcp langchain-groq pydantic python-dotenv
+    pip install orjson  # optional, faster JSON resource serialization
+    pip install uvloop  # optional, faster event loop (not available on Windows)
 
 Usage:
     python freelance_server.py
@@ -22,21 +24,39 @@ Usage:
     uv run mcp dev freelance_server.py
 """
 
+import argparse
+import heapq
 import json
+import logging
 import os
 import re
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
+import anyio
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
 
 from mcp.server.fastmcp import Context, FastMCP
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup; fall back to the default asyncio loop
+    uvloop = None
+
+# Diagnostics go through logging (stderr) - with the stdio transport, stdout
+# carries the JSON-RPC stream and must not be written to directly
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -61,7 +81,7 @@ try:
         temperature=0.7
     )
 except Exception as e:
-    print(f"Warning: Could not initialize ChatGroq: {e}")
+    logger.warning("Could not initialize ChatGroq: %s", e)
     llm = None
 
 
@@ -235,16 +255,41 @@ db = FreelanceDatabase()
 
 
 # Helper Functions
-def calculate_match_score(user_skills: List[str], required_skills: List[str]) -> float:
-    """Calculate skill match score between user and gig requirements"""
+# Per-file locks used by file_lock(), keyed by resolved path. Weak values, so
+# a lock is dropped once no call holds or waits on it
+_file_locks: "weakref.WeakValueDictionary[str, anyio.Lock]" = weakref.WeakValueDictionary()
+
+
+def to_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def normalize_skills(skills: Iterable[str]) -> Set[str]:
+    """Lower-case a list of skills into a set for fast membership checks"""
+    return {skill.lower() for skill in skills}
+
+
+def score_skill_match(user_skills_lower: Set[str], required_skills: List[str]) -> float:
+    """Calculate skill match score against an already normalized set of user skills"""
     if not required_skills:
         return 0.5
     
-    user_skills_lower = [skill.lower() for skill in user_skills]
-    required_skills_lower = [skill.lower() for skill in required_skills]
-    
-    matches = sum(1 for skill in required_skills_lower if skill in user_skills_lower)
-    return matches / len(required_skills_lower)
+    matches = sum(1 for skill in required_skills if skill.lower() in user_skills_lower)
+    return matches / len(required_skills)
+
+
+def file_lock(file_path: str) -> anyio.Lock:
+    """Return the lock that serializes read-modify-write cycles on a file"""
+    # Tool calls run concurrently; without this, two edits to one file both
+    # read the original and the last write silently drops the other's fixes
+    key = os.path.realpath(file_path)
+    lock = _file_locks.get(key)
+    if lock is None:
+        lock = _file_locks[key] = anyio.Lock()
+    return lock
 
 
 def check_rate_compatibility(user_min: float, user_max: float, gig_budget_min: Optional[float], 
@@ -271,6 +316,67 @@ def check_rate_compatibility(user_min: float, user_max: float, gig_budget_min: O
     return 0.5  # Unknown budget
 
 
+# Static reference data (built once at import instead of on every call)
+MARKET_TRENDS = {
+    "hot_skills": ["AI/ML", "React", "Python", "Node.js", "TypeScript"],
+    "average_rates": {
+        "Web Development": "$25-75/hr",
+        "Mobile Development": "$30-80/hr",
+        "Data Science": "$40-100/hr",
+        "AI/ML": "$50-120/hr",
+        "DevOps": "$35-90/hr"
+    },
+    "platform_competition": {
+        "Upwork": "High competition, premium clients",
+        "Fiverr": "Service-based, competitive pricing",
+        "Freelancer": "Mixed budget range, global",
+        "Toptal": "Elite developers, high rates"
+    },
+    "tips": [
+        "Specialize in 2-3 complementary skills",
+        "Build a strong portfolio with case studies",
+        "Maintain 95%+ success rate",
+        "Respond to invitations within 24 hours"
+    ]
+}
+
+# The market trends never change at runtime, so serialize them only once
+MARKET_TRENDS_JSON = to_json(MARKET_TRENDS)
+
+LANGUAGE_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript', 
+    '.ts': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.go': 'Go',
+    '.rs': 'Rust'
+}
+
+# Tuples so callers can't mutate the shared defaults; copy to a list on use
+DEFAULT_JUSTIFICATION_POINTS = (
+    "Extensive experience in required technologies",
+    "Strong track record of successful project delivery",
+    "Additional value through code review and optimization"
+)
+
+PROFILE_HOT_SKILLS = ("AI/ML", "React", "Python", "TypeScript", "Cloud Computing")
+
+# Precompiled patterns used by the validate, code_review and code_debug tools
+NON_DIGIT_RE = re.compile(r"\D")
+BRANCH_KEYWORD_RE = re.compile(r'\b(if|while|for|switch|try|catch|elif|else if)\b')
+PY_FUNCTION_DEF_RE = re.compile(r'def \w+\([^)]*\):')
+PY_FUNCTION_NO_DOC_RE = re.compile(r'def \w+\([^)]*\):\s*\n\s*(?!""")')
+PY_WILDCARD_IMPORT_RE = re.compile(r'from\s+\w+\s+import\s+\*')
+PY_UNDOCUMENTED_DEF_RE = re.compile(r'(def\s+\w+\([^)]*\):\s*\n)(\s*)((?!"""|\'\'\')\S)')
+JS_VAR_RE = re.compile(r'\bvar\b')
+JS_LOOSE_EQ_RE = re.compile(r'(?<!!)==(?!=)')
+JS_LOOSE_NEQ_RE = re.compile(r'!=(?!=)')
+
+
 # Resources
 @mcp.resource("freelance://profile/{profile_id}")
 def get_user_profile(profile_id: str) -> str:
@@ -279,7 +385,7 @@ def get_user_profile(profile_id: str) -> str:
     if not profile:
         return f"Profile {profile_id} not found"
     
-    return json.dumps({
+    return to_json({
         "name": profile.name,
         "title": profile.title,
         "skills": [{"name": s.name, "level": s.level, "experience": s.years_experience} 
@@ -288,7 +394,7 @@ def get_user_profile(profile_id: str) -> str:
         "location": profile.location,
         "success_rate": f"{profile.success_rate}%",
         "total_earnings": f"${profile.total_earnings}"
-    }, indent=2)
+    })
 
 
 @mcp.resource("freelance://gigs/{platform}")
@@ -308,36 +414,13 @@ def get_platform_gigs(platform: str) -> str:
             "posted": gig.posted_date.strftime("%Y-%m-%d %H:%M")
         })
     
-    return json.dumps(gig_summaries, indent=2)
+    return to_json(gig_summaries)
 
 
 @mcp.resource("freelance://market-trends")
 def get_market_trends() -> str:
     """Get current freelance market trends and insights"""
-    trends = {
-        "hot_skills": ["AI/ML", "React", "Python", "Node.js", "TypeScript"],
-        "average_rates": {
-            "Web Development": "$25-75/hr",
-            "Mobile Development": "$30-80/hr",
-            "Data Science": "$40-100/hr",
-            "AI/ML": "$50-120/hr",
-            "DevOps": "$35-90/hr"
-        },
-        "platform_competition": {
-            "Upwork": "High competition, premium clients",
-            "Fiverr": "Service-based, competitive pricing",
-            "Freelancer": "Mixed budget range, global",
-            "Toptal": "Elite developers, high rates"
-        },
-        "tips": [
-            "Specialize in 2-3 complementary skills",
-            "Build a strong portfolio with case studies",
-            "Maintain 95%+ success rate",
-            "Respond to invitations within 24 hours"
-        ]
-    }
-    
-    return json.dumps(trends, indent=2)
+    return MARKET_TRENDS_JSON
 
 
 # Tools
@@ -359,13 +442,18 @@ def search_gigs(skills: List[str], max_budget: Optional[float] = None,
     
     filtered_gigs = []
     
+    # Normalize the search criteria once rather than for every gig
+    platform_filter = {p.lower() for p in platforms} if platforms else None
+    project_type_filter = project_type.lower() if project_type else None
+    user_skills_lower = normalize_skills(skills)
+    
     for gig in db.gigs.values():
         # Platform filter
-        if platforms and gig.platform.value not in [p.lower() for p in platforms]:
+        if platform_filter and gig.platform.value not in platform_filter:
             continue
             
         # Project type filter
-        if project_type and gig.project_type.value != project_type.lower():
+        if project_type_filter and gig.project_type.value != project_type_filter:
             continue
             
         # Budget filters
@@ -380,18 +468,18 @@ def search_gigs(skills: List[str], max_budget: Optional[float] = None,
                 continue
         
         # Skill matching
-        skill_match_score = calculate_match_score(skills, gig.skills_required)
+        skill_match_score = score_skill_match(user_skills_lower, gig.skills_required)
         if skill_match_score > 0:  # At least some skill match
             filtered_gigs.append({
                 "gig": gig,
                 "match_score": skill_match_score
             })
     
-    # Sort by match score
-    filtered_gigs.sort(key=lambda x: x["match_score"], reverse=True)
+    # Keep only the top 10 matches instead of sorting every candidate
+    top_matches = heapq.nlargest(10, filtered_gigs, key=lambda x: x["match_score"])
     
     results = []
-    for item in filtered_gigs[:10]:  # Top 10 matches
+    for item in top_matches:
         gig = item["gig"]
         results.append({
             "id": gig.id,
@@ -441,7 +529,7 @@ def validate() -> str:
         phone = f"{cc}{num}"
 
     # Remove any non-digit characters
-    digits = re.sub(r"\D", "", phone)
+    digits = NON_DIGIT_RE.sub("", phone)
 
     if not digits:
         # Explicit error so it's obvious the server isn't configured
@@ -453,34 +541,47 @@ def validate() -> str:
 
 
 @mcp.tool()
-def analyze_profile_fit(profile_data: Dict[str, Any], gig_id: str) -> Dict[str, Any]:
+def analyze_profile_fit(gig_id: str, profile_data: Optional[Dict[str, Any]] = None,
+                        profile_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyze how well a user profile fits a specific gig
     
     Args:
-        profile_data: User profile information
         gig_id: ID of the gig to analyze fit for
+        profile_data: User profile information (not needed when profile_id is given)
+        profile_id: ID of a profile created with create_user_profile, used
+            instead of resending the full profile_data
     """
     gig = db.gigs.get(gig_id)
     if not gig:
         return {"error": f"Gig {gig_id} not found"}
     
-    user_skills = [skill["name"] for skill in profile_data.get("skills", [])]
-    skill_match_score = calculate_match_score(user_skills, gig.skills_required)
+    if profile_id:
+        profile = db.user_profiles.get(profile_id)
+        if not profile:
+            return {"error": f"Profile {profile_id} not found"}
+        skill_names = [skill.name for skill in profile.skills]
+        rate_min, rate_max = profile.hourly_rate_min, profile.hourly_rate_max
+    elif profile_data is not None:
+        skill_names = [skill["name"] for skill in profile_data.get("skills", [])]
+        rate_min = profile_data.get("hourly_rate_min", 20)
+        rate_max = profile_data.get("hourly_rate_max", 100)
+    else:
+        return {"error": "Either profile_id or profile_data is required"}
+    
+    user_skills_lower = normalize_skills(skill_names)
+    skill_match_score = score_skill_match(user_skills_lower, gig.skills_required)
     
     # Calculate rate compatibility
     rate_compatibility = check_rate_compatibility(
-        profile_data.get("hourly_rate_min", 20),
-        profile_data.get("hourly_rate_max", 100),
+        rate_min,
+        rate_max,
         gig.budget_min,
         gig.budget_max,
         gig.hourly_rate
     )
     
-    # Find matching and missing skills
-    user_skills_lower = [s.lower() for s in user_skills]
-    required_skills_lower = [s.lower() for s in gig.skills_required]
-    
+    # Find matching and missing skills (reusing the normalized skill set)
     skill_matches = [skill for skill in gig.skills_required 
                     if skill.lower() in user_skills_lower]
     missing_skills = [skill for skill in gig.skills_required 
@@ -570,7 +671,7 @@ async def generate_proposal(gig_id: str, user_profile: Dict[str, Any],
     """
     
     try:
-        response = llm.invoke(context)
+        response = await llm.ainvoke(context)
         proposal_text = response.content
         
         # Generate additional metadata
@@ -614,11 +715,7 @@ async def negotiate_rate(current_rate: float, target_rate: float,
         await ctx.info(f"Preparing rate negotiation: ${current_rate} -> ${target_rate}")
     
     if not justification_points:
-        justification_points = [
-            "Extensive experience in required technologies",
-            "Strong track record of successful project delivery",
-            "Additional value through code review and optimization"
-        ]
+        justification_points = list(DEFAULT_JUSTIFICATION_POINTS)
     
     rate_increase = ((target_rate - current_rate) / current_rate) * 100
     
@@ -645,7 +742,7 @@ async def negotiate_rate(current_rate: float, target_rate: float,
     """
     
     try:
-        response = llm.invoke(context)
+        response = await llm.ainvoke(context)
         negotiation_message = response.content
         
         # Calculate negotiation strategy
@@ -731,7 +828,7 @@ def create_user_profile(name: str, title: str, skills_data: List[Dict[str, Any]]
 
 
 @mcp.tool()
-def code_review(file_path: str, review_type: str = "general") -> Dict[str, Any]:
+async def code_review(file_path: str, review_type: str = "general") -> Dict[str, Any]:
     """
     Review code file and provide feedback using LLM analysis
     
@@ -740,30 +837,18 @@ def code_review(file_path: str, review_type: str = "general") -> Dict[str, Any]:
         review_type: Type of review (general, security, performance, style)
     """
     try:
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
+        # File I/O goes through anyio so it doesn't block the event loop
+        file_path_obj = anyio.Path(file_path)
+        if not await file_path_obj.exists():
             return {"error": f"File {file_path} not found"}
         
         # Read file content
-        with open(file_path_obj, 'r', encoding='utf-8') as f:
-            code_content = f.read()
+        code_content = await file_path_obj.read_text(encoding='utf-8')
         
         # Determine file type
         file_extension = file_path_obj.suffix.lower()
-        language_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript', 
-            '.ts': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.go': 'Go',
-            '.rs': 'Rust'
-        }
         
-        language = language_map.get(file_extension, 'Unknown')
+        language = LANGUAGE_MAP.get(file_extension, 'Unknown')
         
         # Perform basic code analysis
         lines = code_content.split('\n')
@@ -772,7 +857,7 @@ def code_review(file_path: str, review_type: str = "general") -> Dict[str, Any]:
         comment_lines = len([line for line in lines if line.strip().startswith(('#', '//', '/*', '*'))])
         
         # Basic complexity analysis
-        cyclomatic_complexity = len(re.findall(r'\b(if|while|for|switch|try|catch|elif|else if)\b', code_content))
+        cyclomatic_complexity = len(BRANCH_KEYWORD_RE.findall(code_content))
         
         # Check for common issues
         issues = []
@@ -782,9 +867,9 @@ def code_review(file_path: str, review_type: str = "general") -> Dict[str, Any]:
         if language == 'Python':
             if 'import *' in code_content:
                 issues.append("Wildcard imports found - use specific imports")
-            if len(re.findall(r'def \w+\([^)]*\):', code_content)) > 0:
+            if len(PY_FUNCTION_DEF_RE.findall(code_content)) > 0:
                 # Check for docstrings
-                functions_without_docs = len(re.findall(r'def \w+\([^)]*\):\s*\n\s*(?!""")', code_content))
+                functions_without_docs = len(PY_FUNCTION_NO_DOC_RE.findall(code_content))
                 if functions_without_docs > 0:
                     suggestions.append("Add docstrings to functions for better documentation")
         
@@ -826,144 +911,155 @@ def code_review(file_path: str, review_type: str = "general") -> Dict[str, Any]:
 
 
 @mcp.tool()
-def code_debug(file_path: str, issue_description: str, fix_type: str = "auto",
-               backup: bool = True) -> Dict[str, Any]:
+async def code_debug(file_path: str, issue_description: str = "", fix_type: str = "auto",
+                     backup: bool = True, issues: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Debug and fix issues in a code file
     
     Args:
         file_path: Path to the code file to debug
-        issue_description: Description of the issue to fix
+        issue_description: Description of the issue to fix (this or issues is required)
         fix_type: Type of fix (auto, manual, suggest)
         backup: Whether to create a backup before making changes
+        issues: Issue descriptions to fix in the same pass (this or issue_description is required)
     """
+    # Several issues are handled in one pass: one read, one backup, one write
+    all_issues = ([issue_description] if issue_description else []) + list(issues or [])
+    if not all_issues:
+        return {"error": "Provide issue_description or issues to fix"}
+    
+    issue_text = "\n".join(all_issues)
+    issue_lower = issue_text.lower()
+    
     try:
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            return {"error": f"File {file_path} not found"}
+        # Hold the file's lock from read to write so concurrent fixes all land
+        async with file_lock(file_path):
+            # File I/O goes through anyio so it doesn't block the event loop
+            file_path_obj = anyio.Path(file_path)
+            if not await file_path_obj.exists():
+                return {"error": f"File {file_path} not found"}
         
-        # Read original content
-        with open(file_path_obj, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+            # Read original content
+            original_content = await file_path_obj.read_text(encoding='utf-8')
         
-        # Create backup if requested
-        backup_path = None
-        if backup:
-            backup_path = f"{file_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(original_content)
+            # Create backup if requested
+            backup_path = None
+            if backup:
+                # Microsecond suffix so back-to-back calls don't overwrite an
+                # earlier backup with already-modified content
+                backup_path = f"{file_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+                await anyio.Path(backup_path).write_text(original_content, encoding='utf-8')
         
-        # Determine file type and common issues
-        file_extension = file_path_obj.suffix.lower()
-        fixes_applied = []
-        modified_content = original_content
+            # Determine file type and common issues
+            file_extension = file_path_obj.suffix.lower()
+            fixes_applied = []
+            modified_content = original_content
         
-        # Language-specific debugging
-        if file_extension == '.py':
-            # Fix Python-specific issues
+            # Language-specific debugging
+            if file_extension == '.py':
+                # Fix Python-specific issues
             
-            # Fix import issues
-            if "import *" in issue_description.lower() or "wildcard" in issue_description.lower():
-                # This is a simplified fix - in practice, you'd need more sophisticated parsing
-                modified_content = re.sub(r'from\s+\w+\s+import\s+\*', 
-                                        '# TODO: Replace wildcard import with specific imports', 
-                                        modified_content)
-                fixes_applied.append("Marked wildcard imports for replacement")
+                # Fix import issues
+                if "import *" in issue_lower or "wildcard" in issue_lower:
+                    # This is a simplified fix - in practice, you'd need more sophisticated parsing
+                    modified_content = PY_WILDCARD_IMPORT_RE.sub(
+                        '# TODO: Replace wildcard import with specific imports', modified_content
+                    )
+                    fixes_applied.append("Marked wildcard imports for replacement")
             
-            # Fix indentation issues
-            if "indentation" in issue_description.lower():
-                lines = modified_content.split('\n')
-                fixed_lines = []
-                for line in lines:
-                    # Convert tabs to spaces
-                    if '\t' in line:
-                        fixed_lines.append(line.expandtabs(4))
-                        if line not in fixes_applied:
-                            fixes_applied.append("Converted tabs to spaces")
-                    else:
-                        fixed_lines.append(line)
-                modified_content = '\n'.join(fixed_lines)
+                # Fix indentation issues
+                if "indentation" in issue_lower:
+                    lines = modified_content.split('\n')
+                    fixed_lines = []
+                    for line in lines:
+                        # Convert tabs to spaces
+                        if '\t' in line:
+                            fixed_lines.append(line.expandtabs(4))
+                            if line not in fixes_applied:
+                                fixes_applied.append("Converted tabs to spaces")
+                        else:
+                            fixed_lines.append(line)
+                    modified_content = '\n'.join(fixed_lines)
             
-            # Add missing docstrings
-            if "docstring" in issue_description.lower() or "documentation" in issue_description.lower():
-                # Add basic docstring to functions without them
-                pattern = r'(def\s+\w+\([^)]*\):\s*\n)(\s*)((?!"""|\'\'\')\S)'
-                def add_docstring(match):
-                    function_def = match.group(1)
-                    indent = match.group(2)
-                    next_line = match.group(3)
-                    docstring = f'{indent}"""TODO: Add function description"""\n{indent}'
-                    return function_def + docstring + next_line
+                # Add missing docstrings
+                if "docstring" in issue_lower or "documentation" in issue_lower:
+                    # Add basic docstring to functions without them
+                    def add_docstring(match):
+                        function_def = match.group(1)
+                        indent = match.group(2)
+                        next_line = match.group(3)
+                        docstring = f'{indent}"""TODO: Add function description"""\n{indent}'
+                        return function_def + docstring + next_line
                 
-                modified_content = re.sub(pattern, add_docstring, modified_content)
-                fixes_applied.append("Added placeholder docstrings to functions")
+                    modified_content = PY_UNDOCUMENTED_DEF_RE.sub(add_docstring, modified_content)
+                    fixes_applied.append("Added placeholder docstrings to functions")
         
-        elif file_extension == '.js':
-            # Fix JavaScript-specific issues
+            elif file_extension == '.js':
+                # Fix JavaScript-specific issues
             
-            # Replace var with let/const
-            if "var" in issue_description.lower():
-                modified_content = re.sub(r'\bvar\b', 'let', modified_content)
-                fixes_applied.append("Replaced 'var' with 'let'")
+                # Replace var with let/const
+                if "var" in issue_lower:
+                    modified_content = JS_VAR_RE.sub('let', modified_content)
+                    fixes_applied.append("Replaced 'var' with 'let'")
             
-            # Fix equality operators
-            if "equality" in issue_description.lower() or "==" in issue_description:
-                modified_content = re.sub(r'(?<!!)==(?!=)', '===', modified_content)
-                modified_content = re.sub(r'!=(?!=)', '!==', modified_content)
-                fixes_applied.append("Replaced loose equality with strict equality")
+                # Fix equality operators
+                if "equality" in issue_lower or "==" in issue_text:
+                    modified_content = JS_LOOSE_EQ_RE.sub('===', modified_content)
+                    modified_content = JS_LOOSE_NEQ_RE.sub('!==', modified_content)
+                    fixes_applied.append("Replaced loose equality with strict equality")
             
-            # Add missing semicolons (basic detection)
-            if "semicolon" in issue_description.lower():
+                # Add missing semicolons (basic detection)
+                if "semicolon" in issue_lower:
+                    lines = modified_content.split('\n')
+                    fixed_lines = []
+                    for line in lines:
+                        stripped = line.rstrip()
+                        if (stripped and 
+                            not stripped.endswith((';', '{', '}', ':', ',')) and
+                            not stripped.startswith(('if', 'for', 'while', 'function', 'class')) and
+                            not line.strip().startswith('//')):
+                            fixed_lines.append(stripped + ';')
+                            if "Added missing semicolons" not in fixes_applied:
+                                fixes_applied.append("Added missing semicolons")
+                        else:
+                            fixed_lines.append(line)
+                    modified_content = '\n'.join(fixed_lines)
+        
+            # General fixes
+            if "whitespace" in issue_lower or "spacing" in issue_lower:
+                # Remove trailing whitespace
                 lines = modified_content.split('\n')
-                fixed_lines = []
-                for line in lines:
-                    stripped = line.rstrip()
-                    if (stripped and 
-                        not stripped.endswith((';', '{', '}', ':', ',')) and
-                        not stripped.startswith(('if', 'for', 'while', 'function', 'class')) and
-                        not line.strip().startswith('//')):
-                        fixed_lines.append(stripped + ';')
-                        if "Added missing semicolons" not in fixes_applied:
-                            fixes_applied.append("Added missing semicolons")
-                    else:
-                        fixed_lines.append(line)
+                fixed_lines = [line.rstrip() for line in lines]
                 modified_content = '\n'.join(fixed_lines)
+                fixes_applied.append("Removed trailing whitespace")
         
-        # General fixes
-        if "whitespace" in issue_description.lower() or "spacing" in issue_description.lower():
-            # Remove trailing whitespace
-            lines = modified_content.split('\n')
-            fixed_lines = [line.rstrip() for line in lines]
-            modified_content = '\n'.join(fixed_lines)
-            fixes_applied.append("Removed trailing whitespace")
+            # Apply fixes if auto mode and changes were made
+            changes_made = modified_content != original_content
         
-        # Apply fixes if auto mode and changes were made
-        changes_made = modified_content != original_content
+            if fix_type == "auto" and changes_made:
+                await file_path_obj.write_text(modified_content, encoding='utf-8')
+                status = "Fixed automatically"
+            elif fix_type == "suggest":
+                status = "Suggestions generated"
+            else:
+                status = "Manual review required"
         
-        if fix_type == "auto" and changes_made:
-            with open(file_path_obj, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            status = "Fixed automatically"
-        elif fix_type == "suggest":
-            status = "Suggestions generated"
-        else:
-            status = "Manual review required"
-        
-        return {
-            "file_path": file_path,
-            "issue_description": issue_description,
-            "fix_type": fix_type,
-            "backup_created": backup_path if backup else None,
-            "fixes_applied": fixes_applied,
-            "changes_made": changes_made,
-            "status": status,
-            "suggestions": [
-                "Review the changes before committing",
-                "Test the code after applying fixes",
-                "Consider running linting tools for additional checks"
-            ],
-            "fixed_at": datetime.now().isoformat()
-        }
+            return {
+                "file_path": file_path,
+                "issue_description": issue_description,
+                "issues": all_issues,
+                "fix_type": fix_type,
+                "backup_created": backup_path if backup else None,
+                "fixes_applied": fixes_applied,
+                "changes_made": changes_made,
+                "status": status,
+                "suggestions": [
+                    "Review the changes before committing",
+                    "Test the code after applying fixes",
+                    "Consider running linting tools for additional checks"
+                ],
+                "fixed_at": datetime.now().isoformat()
+            }
         
     except Exception as e:
         return {"error": f"Failed to debug code: {str(e)}"}
@@ -1013,7 +1109,7 @@ async def optimize_profile(profile_id: str, target_niche: str = "",
     """
     
     try:
-        response = llm.invoke(market_context)
+        response = await llm.ainvoke(market_context)
         recommendations = response.content
         
         # Generate specific action items
@@ -1025,9 +1121,8 @@ async def optimize_profile(profile_id: str, target_niche: str = "",
             action_items.append(f"Consider increasing rates - market average is ${avg_market_rate}/hr")
         
         # Skill gaps analysis
-        hot_skills = ["AI/ML", "React", "Python", "TypeScript", "Cloud Computing"]
         current_skills = [skill.name.lower() for skill in profile.skills]
-        missing_hot_skills = [skill for skill in hot_skills 
+        missing_hot_skills = [skill for skill in PROFILE_HOT_SKILLS 
                             if skill.lower() not in current_skills]
         
         if missing_hot_skills:
@@ -1048,7 +1143,7 @@ async def optimize_profile(profile_id: str, target_niche: str = "",
             "recommendations": recommendations,
             "action_items": action_items,
             "market_insights": {
-                "hot_skills": hot_skills,
+                "hot_skills": list(PROFILE_HOT_SKILLS),
                 "average_rate": f"${avg_market_rate}/hr",
                 "success_rate_target": "95%+",
                 "portfolio_items_recommended": 5
@@ -1100,7 +1195,8 @@ def track_application_status(applications: List[Dict[str, Any]]) -> Dict[str, An
                 responded = datetime.fromisoformat(app['response_date'])
                 response_time = (responded - applied).days
                 response_times.append(response_time)
-            except:
+            except (TypeError, ValueError):
+                # Missing or malformed dates just leave this app out of the average
                 pass
         
         # Calculate success rate
@@ -1148,8 +1244,6 @@ def track_application_status(applications: List[Dict[str, Any]]) -> Dict[str, An
 # Main execution
 def main():
     """Run the Freelance Gig Aggregator MCP server"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Freelance Gig Aggregator MCP Server")
     parser.add_argument("transport", nargs="?", default="stdio", 
                        choices=["stdio", "sse", "streamable-http"],
@@ -1161,14 +1255,17 @@ def main():
     
     if args.transport == "stdio":
         # Run with stdio transport for local connection
-        mcp.run(transport="stdio")
+        if uvloop is not None:
+            anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
+        else:
+            mcp.run(transport="stdio")
     elif args.transport == "sse":
         # Run with SSE transport
-        print(f"Starting SSE server on http://{args.host}:{args.port}")
+        logger.info("Starting SSE server on http://%s:%s", args.host, args.port)
         mcp.run(transport="sse", host=args.host, port=args.port)
     elif args.transport == "streamable-http":
         # Run with HTTP transport
-        print(f"Starting HTTP server on http://{args.host}:{args.port}")
+        logger.info("Starting HTTP server on http://%s:%s", args.host, args.port)
         mcp.run(transport="streamable-http", host=args.host, port=args.port)
 
 
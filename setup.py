@@ -10,6 +10,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "mcp>=1.0.0",
+        "anyio>=4.0.0",
         "langchain-groq>=0.1.0",
         "pydantic>=2.0.0",
         "python-dotenv>=1.0.0",